@@ -1,11 +1,25 @@
+import numpy as np
 import pandas as pd
 import mysql.connector
+from mysql.connector import HAVE_CEXT, errorcode
+from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection
 import logging
+import multiprocessing
 import re
 import os
-from typing import Tuple, Optional, Dict, Any
+import tempfile
+from datetime import date, datetime
+from contextlib import contextmanager
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Tuple, Optional, Dict, Any, List, Iterator, Callable
 from dotenv import load_dotenv
 
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:  # Optional fast reader, openpyxl is used without it
+    CalamineWorkbook = None
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -22,9 +36,23 @@ MYSQL_CONFIG = {
     'host': os.getenv('MYSQL_HOST'),
     'user': os.getenv('MYSQL_USER'),
     'password': os.getenv('MYSQL_PASSWORD'),
-    'database': os.getenv('MYSQL_DATABASE')
+    'database': os.getenv('MYSQL_DATABASE'),
+    # Use the C extension protocol implementation whenever it is installed
+    'use_pure': not HAVE_CEXT,
 }
 TABLE_NAME = 'user'
+INSERT_BATCH_SIZE = 10_000  # Max rows per multi-row INSERT statement
+EXTRACT_CHUNK_SIZE = 50_000  # Max Excel rows parsed, validated and loaded at once
+PARALLEL_VALIDATION_MIN_ROWS = 10_000  # Smaller frames are not worth the process pool overhead
+CONNECTION_POOL_SIZE = 1  # Only one load runs at a time; the pool opens every connection up front
+MAX_PREPARED_PARAMS = 65_535  # MySQL limit on placeholders in one prepared statement
+VALIDATION_CACHE_SIZE = 200_000  # Distinct emails/phones remembered by the scalar validators
+
+# Server/client refusals of LOAD DATA LOCAL INFILE that trigger the INSERT fallback
+LOCAL_INFILE_DISABLED_ERRORS = {
+    errorcode.ER_NOT_ALLOWED_COMMAND,
+    errorcode.ER_CLIENT_LOCAL_FILES_DISABLED,
+}
 
 # Mapping from Excel (Russian) to MySQL (English) columns
 COLUMN_MAP = {
@@ -75,13 +103,41 @@ COUNTRY_CODES = {
     'AE': {'codes': ['971'], 'length': 12},
 }
 
+# Country code prefix -> (country, expected length including '+'); first listed country wins
+# Lookups stay plain dict probes rather than a Numba/Cython kernel: a phone needs at most
+# one probe per code length, which does not pay for a build or JIT dependency
+_CODE_TABLE: Dict[str, Tuple[str, int]] = {}
+for _country, _info in COUNTRY_CODES.items():
+    for _code in _info['codes']:
+        _CODE_TABLE.setdefault(_code, (_country, 1 + _info['length']))
+_CODE_LENGTHS = sorted({len(code) for code in _CODE_TABLE}, reverse=True)
+
+# Precompiled patterns used by the cleaning and validation helpers. Stdlib re is kept
+# over RE2: for these short per-cell strings RE2's call overhead dominates, and RE2's
+# ASCII-only \w/\s would reject Unicode emails and miss non-breaking spaces
+_WS_RE = re.compile(r'\s+')
+_EMAIL_RE = re.compile(r'^[\w\.-]+@[\w\.-]+\.\w+$')
+
+class _DigitKeepTable(dict):
+    """str.translate table that keeps decimal digits (same set as regex \\d) and drops the rest."""
+    
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        # Filled lazily so the table only holds characters actually seen
+        value = codepoint if chr(codepoint).isdecimal() else None
+        self[codepoint] = value
+        return value
+
+_KEEP_DIGITS = _DigitKeepTable()
+
 class ETLProcessor:
     """ETL processor for user data from Excel to MySQL."""
     
-    def __init__(self, excel_file: str, mysql_config: Dict[str, str], table_name: str):
+    def __init__(self, excel_file: str, mysql_config: Dict[str, Any], table_name: str):
         self.excel_file = excel_file
         self.mysql_config = mysql_config
         self.table_name = table_name
+        self._pool: Optional[MySQLConnectionPool] = None
+        self._validation_pool: Optional[ProcessPoolExecutor] = None
         self._validate_config()
     
     def _validate_config(self) -> None:
@@ -93,35 +149,47 @@ class ETLProcessor:
         
         if not os.path.exists(self.excel_file):
             raise FileNotFoundError(f"Excel file not found: {self.excel_file}")
+        
+        if self.mysql_config.get('use_pure', not HAVE_CEXT):
+            logger.warning("MySQL C extension is not used, falling back to the slower pure-Python protocol")
     
     @staticmethod
     def remove_double_spaces(text: Any) -> str:
         """Remove double spaces and trim whitespace."""
         if isinstance(text, str):
-            return re.sub(r'\s+', ' ', text).strip()
+            return _WS_RE.sub(' ', text).strip()
         return str(text) if text is not None else ""
     
     @staticmethod
+    def _clean_string_column(column: pd.Series) -> pd.Series:
+        """Remove double spaces and trim whitespace across a whole column."""
+        return column.str.replace(_WS_RE, ' ', regex=True).str.strip()
+    
+    @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_email(email: Any) -> Tuple[Optional[str], str]:
         """Validate email format."""
-        if pd.isna(email) or not email:
+        if pd.isna(email):
             return None, "Email is empty"
         
         email_clean = ETLProcessor.remove_double_spaces(str(email))
-        pattern = r'^[\w\.-]+@[\w\.-]+\.\w+$'
-        
-        if re.match(pattern, email_clean):
+        if not email_clean:
+            return None, "Email is empty"
+        if _EMAIL_RE.match(email_clean):
             return email_clean, ""
         return None, f"Invalid email format: {email_clean}"
     
     @staticmethod
+    @lru_cache(maxsize=VALIDATION_CACHE_SIZE)
     def validate_phone(phone: Any) -> Tuple[Optional[str], str]:
         """Validate and format phone number."""
-        if pd.isna(phone) or not phone:
+        if pd.isna(phone):
             return None, "Phone is empty"
         
         phone_raw = ETLProcessor.remove_double_spaces(str(phone))
-        phone_digits = re.sub(r'\D', '', phone_raw)
+        if not phone_raw:
+            return None, "Phone is empty"
+        phone_digits = phone_raw.translate(_KEEP_DIGITS)
         
         if len(phone_digits) < 10:
             return None, f"Phone too short: {phone_raw}"
@@ -156,102 +224,153 @@ class ETLProcessor:
         if not phone_clean or not phone_clean.startswith('+'):
             return "Missing country code"
         
-        for country, info in COUNTRY_CODES.items():
-            for code in info['codes']:
-                if phone_clean.startswith('+' + code):
-                    expected_length = len(code) + 1 + (info['length'] - len(code))
-                    if len(phone_clean) == expected_length:
-                        return ""  # Valid
-                    else:
-                        return f"Invalid length for {country}"
+        # Longest prefix first, at most one dict lookup per code length
+        for code_len in _CODE_LENGTHS:
+            hit = _CODE_TABLE.get(phone_clean[1:1 + code_len])
+            if hit:
+                country, expected_length = hit
+                if len(phone_clean) == expected_length:
+                    return ""  # Valid
+                return f"Invalid length for {country}"
         
         return "Unknown country code"
     
-    @staticmethod
-    def validate_age(age: Any) -> Tuple[Optional[int], str]:
-        """Validate age value."""
-        if pd.isna(age) or age == "":
-            return None, "Age is empty"
-        
-        try:
-            age_val = float(age)
-            age_int = int(round(age_val))
-            if 18 <= age_int <= 120:
-                return age_int, ""
-            else:
-                return None, f"Age {age_int} out of range (18-120)"
-        except (ValueError, TypeError):
-            return None, f"Invalid age format: {age}"
-    
     def extract_data(self) -> pd.DataFrame:
         """Extract and validate data from Excel file."""
         logger.info(f"Extracting data from {self.excel_file}")
         
         try:
-            df = pd.read_excel(self.excel_file)
+            df = self._read_excel()
             logger.info(f"Loaded {len(df)} rows from Excel")
         except Exception as e:
             logger.error(f"Failed to read Excel file: {e}")
             raise
         
+        df = self._transform(df)
+        logger.info("Data extraction and validation completed")
+        return df
+    
+    def extract_chunks(self, chunk_size: int = EXTRACT_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+        """Extract and validate data from Excel file in chunks of at most chunk_size rows."""
+        if CalamineWorkbook is None:
+            logger.warning("python-calamine is not installed, reading Excel in one go")
+            yield self.extract_data()
+            return
+        
+        logger.info(f"Streaming data from {self.excel_file} in chunks of {chunk_size} rows")
+        try:
+            workbook = CalamineWorkbook.from_path(self.excel_file)
+            rows = workbook.get_sheet_by_index(0).iter_rows()
+        except Exception as e:
+            logger.error(f"Failed to read Excel file: {e}")
+            raise
+        
+        with workbook:
+            header = None
+            chunk = []
+            blank_rows = []
+            for row in rows:
+                values = [_convert_cell(value) for value in row]
+                if header is None:
+                    if any(value is not None for value in values):
+                        header = values
+                    continue
+                # Like read_excel, keep blank rows between data rows but drop trailing ones
+                if all(value is None for value in values):
+                    blank_rows.append(values)
+                    continue
+                for values in blank_rows + [values]:
+                    chunk.append(values)
+                    if len(chunk) >= chunk_size:
+                        yield self._transform_chunk(chunk, header)
+                        chunk = []
+                blank_rows = []
+            if chunk:
+                yield self._transform_chunk(chunk, header)
+    
+    def _transform_chunk(self, rows: List[list], header: list) -> pd.DataFrame:
+        """Build a frame from streamed rows and validate it."""
+        logger.info(f"Loaded {len(rows)} rows from Excel")
+        # object dtype keeps each cell as read, like the one-shot path, instead of
+        # inferring per chunk (e.g. integer phones plus a blank would become floats)
+        return self._transform(pd.DataFrame(rows, columns=header, dtype=object))
+    
+    def _transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rename, clean and validate raw Excel rows."""
         # Rename columns
         df = df.rename(columns=COLUMN_MAP)
         
+        # Type text columns once: missing cells become pd.NA and numeric cells
+        # (digit-only phones) become text, so no per-cell type checks are needed
+        string_columns = [
+            col for col in ['full_name', 'phone', 'country', 'region', 'email']
+            if col in df.columns
+        ]
+        df[string_columns] = df[string_columns].astype('string')
+        
         # Clean string columns
-        string_columns = ['full_name', 'phone', 'country', 'region', 'email']
-        for col in string_columns:
-            if col in df.columns:
-                df[col] = df[col].apply(self.remove_double_spaces)
+        # (email and phone are cleaned by their validators in the same pass)
+        clean_columns = [col for col in ['full_name', 'country', 'region'] if col in df.columns]
+        df[clean_columns] = df[clean_columns].apply(self._clean_string_column)
         
         # Validate and collect errors
         df = self._validate_dataframe(df)
         
-        logger.info("Data extraction and validation completed")
         return df[list(COLUMN_MAP.values()) + ['errors']]
     
+    def _read_excel(self, **kwargs: Any) -> pd.DataFrame:
+        """Read the Excel file with the calamine engine, falling back to openpyxl."""
+        # Only empty cells are missing values, same as in the streamed path
+        kwargs.setdefault('keep_default_na', False)
+        kwargs.setdefault('na_values', [''])
+        try:
+            return pd.read_excel(self.excel_file, engine='calamine', **kwargs)
+        except ImportError:
+            logger.warning("python-calamine is not installed, reading Excel with openpyxl")
+            return pd.read_excel(self.excel_file, engine='openpyxl', **kwargs)
+    
     def _validate_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Validate all rows in dataframe and collect errors."""
-        errors = []
-        emails = []
-        phones = []
-        ages = []
-        
-        for idx, row in df.iterrows():
-            row_errors = []
-            
-            # Check required fields
-            required_fields = ['full_name', 'country', 'region']
-            for field in required_fields:
-                if pd.isna(row.get(field)) or not str(row.get(field)).strip():
-                    row_errors.append(f"{field} is empty")
-            
-            # Validate email
-            email, email_err = self.validate_email(row.get('email'))
-            emails.append(email)
-            if email_err:
-                row_errors.append(email_err)
-            
-            # Validate phone
-            phone, phone_err = self.validate_phone(row.get('phone'))
-            phones.append(phone)
-            if phone_err:
-                row_errors.append(phone_err)
-            
-            # Validate age
-            age, age_err = self.validate_age(row.get('age'))
-            ages.append(age)
-            if age_err:
-                row_errors.append(age_err)
-            
-            errors.append("; ".join(row_errors) if row_errors else "")
+        """Validate all rows in dataframe, splitting large frames across worker processes."""
+        workers = os.cpu_count() or 1
+        if workers < 2 or len(df) < PARALLEL_VALIDATION_MIN_ROWS:
+            return _validate_chunk(df)
         
-        # Update dataframe with validated data
-        df['email'] = emails
-        df['phone'] = phones
-        df['age'] = ages
-        df['errors'] = errors
+        chunk_len = -(-len(df) // workers)
+        chunks = [df.iloc[start:start + chunk_len] for start in range(0, len(df), chunk_len)]
+        if self._validation_pool is not None:
+            return pd.concat(self._validation_pool.map(_validate_chunk, chunks))
+        with _new_validation_pool(workers) as executor:
+            return pd.concat(executor.map(_validate_chunk, chunks))
+    
+    @staticmethod
+    def _validate_email_column(emails: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """Clean and validate emails for a whole column in a single pass."""
+        return _validate_in_one_pass(ETLProcessor.validate_email, emails)
+    
+    @staticmethod
+    def _validate_phone_column(phones: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """Clean, validate and format phone numbers for a whole column in a single pass."""
+        return _validate_in_one_pass(ETLProcessor.validate_phone, phones)
+    
+    @staticmethod
+    def _validate_age_column(ages: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """Validate age values for a whole column."""
+        age_num = pd.to_numeric(ages, errors='coerce').astype(float)
+        age_num = age_num.where(np.isfinite(age_num))
+        is_empty = ages.isna() | ages.eq('')
+        is_invalid = ~is_empty & age_num.isna()
+        age_int = age_num.round()
+        in_range = age_int.between(18, 120)
+        out_of_range = ~is_empty & ~is_invalid & ~in_range
         
-        return df
+        # Messages are only formatted for the rows that need them
+        errors = pd.Series('', index=ages.index, dtype=object)
+        errors[is_empty] = "Age is empty"
+        errors[is_invalid] = "Invalid age format: " + ages[is_invalid].astype(str)
+        errors[out_of_range] = (
+            "Age " + age_int[out_of_range].map(int).astype(str) + " out of range (18-120)"
+        )
+        return age_int.where(in_range).astype('Int64'), errors
     
     def recreate_database_and_table(self) -> None:
         """Recreate database and table."""
@@ -269,8 +388,14 @@ class ETLProcessor:
                     conn.commit()
                     logger.info(f"Database {db_name} recreated")
             
+            # Connections opened before the drop point at the old database; close
+            # them rather than leaving their sessions open on the server
+            if self._pool is not None:
+                self._pool._remove_connections()
+                self._pool = None
+            
             # Create table in new database
-            with mysql.connector.connect(**self.mysql_config) as conn:
+            with self._get_connection() as conn:
                 with conn.cursor() as cursor:
                     cursor.execute(f"DROP TABLE IF EXISTS {self.table_name}")
                     cursor.execute(TABLE_SCHEMA)
@@ -281,52 +406,280 @@ class ETLProcessor:
             logger.error(f"Database error: {e}")
             raise
     
+    def _get_connection(self) -> PooledMySQLConnection:
+        """Get a connection to the target database from the shared pool."""
+        if self._pool is None:
+            self._pool = MySQLConnectionPool(
+                pool_name='etl',
+                pool_size=CONNECTION_POOL_SIZE,
+                pool_reset_session=False,
+                # LOCAL INFILE may only read the temporary CSVs written by _load_data_infile
+                allow_local_infile_in_path=tempfile.gettempdir(),
+                **self.mysql_config,
+            )
+        return self._pool.get_connection()
+    
     def load_to_mysql(self, df: pd.DataFrame) -> None:
-        """Load dataframe to MySQL table."""
-        logger.info(f"Loading {len(df)} rows to MySQL table {self.table_name}")
-        
+        """Load dataframe to MySQL table in its own transaction."""
         try:
-            with mysql.connector.connect(**self.mysql_config) as conn:
-                with conn.cursor() as cursor:
-                    cols = ','.join(df.columns)
-                    placeholders = ','.join(['%s'] * len(df.columns))
-                    insert_sql = f"INSERT INTO {self.table_name} ({cols}) VALUES ({placeholders})"
-                    
-                    # Convert DataFrame to list of tuples, handling NaN values
-                    data = []
-                    for row in df.itertuples(index=False, name=None):
-                        clean_row = tuple(
-                            None if pd.isna(x) else x for x in row
-                        )
-                        data.append(clean_row)
-                    
-                    cursor.executemany(insert_sql, data)
-                    conn.commit()
-                    logger.info(f"Successfully inserted {len(data)} rows")
-                    
+            with self._get_connection() as conn:
+                with self._load_transaction(conn) as cursor:
+                    self._load_frame(conn, cursor, df)
         except mysql.connector.Error as e:
             logger.error(f"Failed to load data to MySQL: {e}")
             raise
     
+    @contextmanager
+    def _load_transaction(self, conn: PooledMySQLConnection) -> Iterator[Any]:
+        """Open one transaction for bulk loads on conn, committed when the block exits cleanly."""
+        with conn.cursor() as cursor:
+            # Relax per-row checks for the bulk load, restored below
+            self._set_load_checks(cursor, False)
+            try:
+                conn.start_transaction()
+                yield cursor
+                conn.commit()
+            except Exception:
+                # Clean up only on a live connection, so a dropped one still
+                # surfaces the original error rather than a failed cleanup
+                if conn.is_connected():
+                    conn.rollback()
+                    self._set_load_checks(cursor, True)
+                raise
+            self._set_load_checks(cursor, True)
+    
+    def _load_frame(self, conn: PooledMySQLConnection, cursor: Any, df: pd.DataFrame) -> int:
+        """Load dataframe inside the caller's transaction, preferring LOAD DATA LOCAL INFILE."""
+        logger.info(f"Loading {len(df)} rows to MySQL table {self.table_name}")
+        try:
+            inserted = self._load_data_infile(cursor, df)
+        except mysql.connector.Error as e:
+            if e.errno not in LOCAL_INFILE_DISABLED_ERRORS:
+                raise
+            logger.warning(f"LOAD DATA LOCAL INFILE unavailable ({e}), falling back to INSERT batches")
+            inserted = self._insert_batches(conn, df)
+        logger.info(f"Successfully inserted {inserted} rows")
+        return inserted
+    
+    @staticmethod
+    def _set_load_checks(cursor: Any, enabled: bool) -> None:
+        """Enable or disable the per-row unique and foreign key checks of the session."""
+        value = int(enabled)
+        cursor.execute(f"SET unique_checks={value}")
+        cursor.execute(f"SET foreign_key_checks={value}")
+    
+    def _load_data_infile(self, cursor: Any, df: pd.DataFrame) -> int:
+        """Stream dataframe into the table via a temporary CSV and LOAD DATA LOCAL INFILE."""
+        csv_df = df.copy()
+        for col in csv_df.columns:
+            if pd.api.types.is_string_dtype(csv_df[col]):
+                # Backslash is the LOAD DATA escape character
+                csv_df[col] = csv_df[col].str.replace('\\', '\\\\', regex=False)
+        if 'age' in csv_df.columns:
+            csv_df['age'] = csv_df['age'].astype('Int64')
+        
+        with tempfile.NamedTemporaryFile(
+            'w', suffix='.csv', encoding='utf-8', newline='', delete=False
+        ) as tmp:
+            csv_df.to_csv(tmp, index=False, header=False, na_rep='\\N', lineterminator='\n')
+        
+        try:
+            cols = ','.join(df.columns)
+            # Backslashes in Windows temp paths would be read as escapes in the literal
+            csv_path = tmp.name.replace('\\', '/')
+            cursor.execute(
+                f"LOAD DATA LOCAL INFILE '{csv_path}' INTO TABLE {self.table_name} "
+                "CHARACTER SET utf8mb4 "
+                "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' "
+                "LINES TERMINATED BY '\\n' "
+                f"({cols})"
+            )
+            loaded = cursor.rowcount
+            
+            # LOCAL implies IGNORE: bad values are truncated or skipped with warnings
+            # instead of failing like INSERT does in strict mode, so fail here
+            warning_count = cursor.warning_count
+            if warning_count:
+                cursor.execute("SHOW WARNINGS LIMIT 5")
+                details = "; ".join(f"{code}: {message}" for _, code, message in cursor.fetchall())
+                raise mysql.connector.DataError(
+                    msg=f"LOAD DATA reported {warning_count} warnings: {details}"
+                )
+            return loaded
+        finally:
+            os.remove(tmp.name)
+    
+    def _insert_batches(self, conn: PooledMySQLConnection, df: pd.DataFrame) -> int:
+        """Insert dataframe rows using multi-row INSERT batches as server-side prepared statements."""
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT @@max_allowed_packet")
+            max_packet = int(cursor.fetchone()[0])
+        
+        # Convert DataFrame to list of tuples, replacing NaN with None in one vectorized pass
+        if 'age' in df.columns:
+            df = df.assign(age=df['age'].astype('Int64'))
+        df_clean = df.astype(object).where(df.notna(), None)
+        data = list(df_clean.itertuples(index=False, name=None))
+        
+        columns = list(df.columns)
+        max_rows = min(INSERT_BATCH_SIZE, MAX_PREPARED_PARAMS // len(columns))
+        # The prepared cursor re-prepares whenever it is handed a different SQL string
+        # object, so statements are cached per batch size
+        statements: Dict[int, str] = {}
+        inserted = 0
+        with conn.cursor(prepared=True) as cursor:
+            for batch in self._iter_insert_batches(data, max_packet // 2, max_rows):
+                insert_sql = statements.get(len(batch))
+                if insert_sql is None:
+                    insert_sql = statements[len(batch)] = self._build_insert_sql(columns, len(batch))
+                params = [value for row in batch for value in row]
+                cursor.execute(insert_sql, params)
+                inserted += len(batch)
+        return inserted
+    
+    def _build_insert_sql(self, columns: List[str], row_count: int) -> str:
+        """Build a multi-row INSERT statement for the given number of rows."""
+        cols = ','.join(columns)
+        row_placeholders = '(' + ','.join(['%s'] * len(columns)) + ')'
+        values = ','.join([row_placeholders] * row_count)
+        return f"INSERT INTO {self.table_name} ({cols}) VALUES {values}"
+    
+    @staticmethod
+    def _iter_insert_batches(
+        rows: List[tuple], max_bytes: int, max_rows: int
+    ) -> Iterator[List[tuple]]:
+        """Split rows into batches bounded by row count and estimated statement size."""
+        batch = []
+        batch_bytes = 0
+        for row in rows:
+            # Quoting, escaping and separators add a few bytes per value
+            row_bytes = sum(len(str(value).encode('utf-8')) + 4 for value in row)
+            if batch and (len(batch) >= max_rows or batch_bytes + row_bytes > max_bytes):
+                yield batch
+                batch = []
+                batch_bytes = 0
+            batch.append(row)
+            batch_bytes += row_bytes
+        if batch:
+            yield batch
+    
     def run_etl(self) -> None:
         """Run the complete ETL process."""
         logger.info("Starting ETL process")
         
         try:
             self.recreate_database_and_table()
-            df = self.extract_data()
-            self.load_to_mysql(df)
+            
+            # Load each chunk in the background while the next one is parsed. All
+            # chunks share one transaction, so a failed chunk rolls back the whole
+            # run; the loader is shut down before the transaction ends. The
+            # validation pool is shared by all chunks and never forks this process
+            record_count = 0
+            error_count = 0
+            with self._get_connection() as conn, self._load_transaction(conn) as cursor:
+                with _new_validation_pool(os.cpu_count() or 1) as validation_pool, \
+                        ThreadPoolExecutor(max_workers=1) as loader:
+                    self._validation_pool = validation_pool
+                    try:
+                        pending = None
+                        for df in self.extract_chunks():
+                            if pending is not None:
+                                pending.result()
+                            pending = loader.submit(self._load_frame, conn, cursor, df)
+                            record_count += len(df)
+                            error_count += int((df['errors'] != '').sum())
+                        if pending is not None:
+                            pending.result()
+                    finally:
+                        self._validation_pool = None
             logger.info("ETL process completed successfully")
             
             # Log summary statistics
-            error_count = len(df[df['errors'] != ''])
-            logger.info(f"Processed {len(df)} records, {error_count} with validation errors")
+            logger.info(f"Processed {record_count} records, {error_count} with validation errors")
             
         except Exception as e:
             logger.error(f"ETL process failed: {e}")
             raise
 
 
+def _new_validation_pool(workers: int) -> ProcessPoolExecutor:
+    """Create a validation process pool that does not fork the (threaded) ETL process."""
+    # Workers start lazily on first use, so an unused pool costs nothing
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context(start_method)
+    )
+
+
+def _validate_chunk(df: pd.DataFrame) -> pd.DataFrame:
+    """Validate all rows in dataframe and collect errors."""
+    error_parts = []
+    
+    # Check required fields
+    required_fields = ['full_name', 'country', 'region']
+    for field in required_fields:
+        # Values are already cleaned, so blank cells are exactly ''
+        values = df[field]
+        is_empty = values.isna() | values.eq('')
+        error_parts.append(pd.Series(np.where(is_empty, f"{field} is empty", ''), index=df.index))
+    
+    # Validate email, phone and age column-wise
+    emails, email_errors = _validate_distinct(ETLProcessor._validate_email_column, df['email'])
+    phones, phone_errors = _validate_distinct(ETLProcessor._validate_phone_column, df['phone'])
+    ages, age_errors = _validate_distinct(ETLProcessor._validate_age_column, df['age'])
+    error_parts.extend([email_errors, phone_errors, age_errors])
+    
+    # Update dataframe with validated data
+    df['email'] = emails
+    df['phone'] = phones
+    df['age'] = ages
+    # Join non-empty messages with "; " column by column instead of row by row
+    errors = pd.Series('', index=df.index, dtype=object)
+    for part in error_parts:
+        separator = np.where(errors.ne('') & part.ne(''), "; ", '')
+        errors = errors + separator + part
+    df['errors'] = errors
+    
+    return df
+
+
+def _validate_distinct(
+    validator: Callable[[pd.Series], Tuple[pd.Series, pd.Series]], values: pd.Series
+) -> Tuple[pd.Series, pd.Series]:
+    """Run a column validator on distinct values only and broadcast the results back."""
+    codes, uniques = values.factorize(use_na_sentinel=False)
+    if len(uniques) == len(values):
+        return validator(values)
+    
+    valid, errors = validator(pd.Series(uniques))
+    return valid.take(codes).set_axis(values.index), errors.take(codes).set_axis(values.index)
+
+
+def _validate_in_one_pass(
+    validator: Callable[[Any], Tuple[Optional[str], str]], values: pd.Series
+) -> Tuple[pd.Series, pd.Series]:
+    """Clean and validate every value with a scalar validator in a single loop over the column."""
+    results = [validator(value) for value in values]
+    cleaned = [value for value, _ in results]
+    errors = [error for _, error in results]
+    return (
+        pd.Series(cleaned, index=values.index, dtype=object),
+        pd.Series(errors, index=values.index, dtype=object),
+    )
+
+
+def _convert_cell(value: Any) -> Any:
+    """Convert a calamine cell value the way pandas' calamine reader does."""
+    if value == '':
+        return None
+    if isinstance(value, float):
+        # Excel stores all numbers as floats; whole numbers (e.g. phones) become ints
+        return int(value) if value.is_integer() else value
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
 def main():
     """Main entry point."""
     try: